@@ -1,6 +1,19 @@
 import flet as ft
 from data_store import DataStore, EventType
 
+# Number of device cards built at once for each group
+CARDS_PER_PAGE = 6
+
+# Responsive column span of a card (out of 12)
+CARD_COLUMNS = {"xs": 12, "sm": 6, "md": 4}
+
+GROUP_TITLES = {
+    "light": "Lights",
+    "door": "Security",
+    "temp": "Temperature",
+    "fan": "Climate",
+}
+
 def OverviewView(page: ft.Page):
     """
     Generates the content for the Overview/Main Dashboard page.
@@ -171,16 +184,73 @@ def OverviewView(page: ft.Page):
             content=ft.Column(controls=card_controls)
         )
 
-    # --- Assembly ---
-    on_off_controls = []
-    slider_controls = []
+    # --- Grouped, paginated grid ---
+    # Devices are grouped by type and only the current page of each group is
+    # built. Cards leaving the page are unregistered so the update dictionaries
+    # only ever hold the visible controls.
+    def unregister_device(device_id):
+        device_status_texts.pop(device_id, None)
+        device_buttons.pop(device_id, None)
+
+    def create_device_group(device_type, devices):
+        state = {"page": 0}
+        page_count = (len(devices) + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE
+
+        grid = ft.ResponsiveRow(spacing=10, run_spacing=10)
+        page_label = ft.Text(color=ft.Colors.GREY_700)
+        prev_btn = ft.IconButton(icon=ft.Icons.CHEVRON_LEFT)
+        next_btn = ft.IconButton(icon=ft.Icons.CHEVRON_RIGHT)
+
+        def render_page():
+            for old_card in grid.controls:
+                unregister_device(old_card.data)
+
+            start = state["page"] * CARDS_PER_PAGE
+            grid.controls = [
+                ft.Column([create_device_card(device)], col=CARD_COLUMNS, data=device["id"])
+                for device in devices[start:start + CARDS_PER_PAGE]
+            ]
+            page_label.value = f"{state['page'] + 1} / {page_count}"
+            prev_btn.disabled = state["page"] == 0
+            next_btn.disabled = state["page"] >= page_count - 1
+
+        def change_page(delta):
+            state["page"] = max(0, min(page_count - 1, state["page"] + delta))
+            render_page()
+            if grid.page:
+                grid.update()
+                pager.update()
+
+        prev_btn.on_click = lambda e: change_page(-1)
+        next_btn.on_click = lambda e: change_page(1)
 
+        pager = ft.Row(controls=[prev_btn, page_label, next_btn], visible=page_count > 1)
+        render_page()
+
+        return ft.Column(controls=[
+            ft.Row(
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                controls=[
+                    ft.Text(
+                        f"{GROUP_TITLES.get(device_type, device_type.title())} ({len(devices)})",
+                        size=20, weight=ft.FontWeight.BOLD
+                    ),
+                    pager,
+                ]
+            ),
+            grid,
+        ])
+
+    # --- Assembly ---
+    devices_by_type = {}
     for device in DataStore.devices:
-        card = create_device_card(device)
-        if device["is_slider"]:
-            slider_controls.append(ft.Column([card], expand=1))
-        else:
-            on_off_controls.append(ft.Column([card], expand=1))
+        devices_by_type.setdefault(device["type"], []).append(device)
+
+    group_controls = []
+    for device_type, devices in devices_by_type.items():
+        if group_controls:
+            group_controls.append(ft.Divider(height=30))
+        group_controls.append(create_device_group(device_type, devices))
 
     return ft.View(
         route="/",
@@ -194,13 +264,7 @@ def OverviewView(page: ft.Page):
                 expand=True,
                 content=ft.Column(
                     scroll=ft.ScrollMode.AUTO,
-                    controls=[
-                        ft.Text("On/Off devices", size=20, weight=ft.FontWeight.BOLD),
-                        ft.Row(controls=on_off_controls),
-                        ft.Divider(height=30),
-                        ft.Text("Slider controlled devices", size=20, weight=ft.FontWeight.BOLD),
-                        ft.Row(controls=slider_controls),
-                    ]
+                    controls=group_controls
                 )
             )
         ],